@@ -9,6 +9,7 @@ from supertrend_strategy import supertrend_tv
 
 __all__ = [
     "BacktestResult",
+    "backtest_intrabar",
     "backtest_signals",
     "plot_results",
     "run_supertrend_backtest",
@@ -34,6 +35,35 @@ class BacktestResult:
         return self.metrics
 
 
+def _finalize_backtest(bt: pd.DataFrame, initial_capital: float) -> Dict[str, float]:
+    """
+    Derive cumulative, drawdown, and equity columns from ``returns``/``strategy_returns``
+    in place and return the summary metrics.
+    """
+    bt["cumulative_returns"] = (1 + bt["returns"]).cumprod()
+    bt["cumulative_strategy_returns"] = (1 + bt["strategy_returns"]).cumprod()
+
+    bt["peak"] = bt["cumulative_strategy_returns"].cummax()
+    bt["drawdown"] = bt["cumulative_strategy_returns"] / bt["peak"] - 1
+
+    total_return = bt["cumulative_strategy_returns"].iloc[-1] - 1
+    max_drawdown = bt["drawdown"].min()
+
+    trading_returns = bt["strategy_returns"]
+    volatility = trading_returns.std(ddof=0)
+    sharpe_ratio = np.nan
+    if volatility > 0:
+        sharpe_ratio = (trading_returns.mean() / volatility) * np.sqrt(252)
+
+    bt["equity"] = initial_capital * bt["cumulative_strategy_returns"]
+
+    return {
+        "total_return": float(total_return),
+        "max_drawdown": float(max_drawdown),
+        "sharpe_ratio": float(sharpe_ratio) if not np.isnan(sharpe_ratio) else np.nan,
+    }
+
+
 def backtest_signals(
     df: pd.DataFrame,
     *,
@@ -110,28 +140,210 @@ def backtest_signals(
     bt["returns"] = bt[price_column].pct_change().fillna(0.0)
     bt["strategy_returns"] = bt["position"].shift(1).fillna(0.0) * bt["returns"]
 
-    bt["cumulative_returns"] = (1 + bt["returns"]).cumprod()
-    bt["cumulative_strategy_returns"] = (1 + bt["strategy_returns"]).cumprod()
+    metrics = _finalize_backtest(bt, initial_capital)
 
-    bt["peak"] = bt["cumulative_strategy_returns"].cummax()
-    bt["drawdown"] = bt["cumulative_strategy_returns"] / bt["peak"] - 1
+    return BacktestResult(
+        dataframe=bt,
+        equity_curve=bt["equity"],
+        metrics=metrics,
+        strategy_name=strategy_name,
+        parameters=parameters,
+    )
 
-    total_return = bt["cumulative_strategy_returns"].iloc[-1] - 1
-    max_drawdown = bt["drawdown"].min()
 
-    trading_returns = bt["strategy_returns"]
-    volatility = trading_returns.std(ddof=0)
-    sharpe_ratio = np.nan
-    if volatility > 0:
-        sharpe_ratio = (trading_returns.mean() / volatility) * np.sqrt(252)
+def backtest_intrabar(
+    df: pd.DataFrame,
+    lower_df: pd.DataFrame,
+    *,
+    signal_column: str = "signal",
+    price_column: str = "close",
+    stop_column: Optional[str] = None,
+    slippage_bps: float = 0.0,
+    bar_width: Optional[pd.Timedelta] = None,
+    initial_capital: float = 10000.0,
+    strategy_name: str = "Strategy",
+    parameters: Optional[Dict[str, float]] = None,
+) -> BacktestResult:
+    """
+    Long-only backtest that resolves fills inside each signal bar using a lower-timeframe series.
 
-    bt["equity"] = initial_capital * bt["cumulative_strategy_returns"]
+    Signals are interpreted exactly as in :func:`backtest_signals`: the position decided on
+    signal bar ``t`` is held during bar ``t + 1``. Instead of assuming a fill at the bar close,
+    entries and signal exits fill at the open of the first lower-timeframe bar of ``t + 1``.
+    When ``stop_column`` is given, its value on bar ``t`` acts as a protective stop for bar
+    ``t + 1``; the first lower-timeframe bar whose low touches the stop closes the trade at
+    the stop (or at that bar's open when price gaps through it), and the position stays flat
+    until the next entry signal. Slippage is applied against the trader on every fill.
 
-    metrics = {
-        "total_return": float(total_return),
-        "max_drawdown": float(max_drawdown),
-        "sharpe_ratio": float(sharpe_ratio) if not np.isnan(sharpe_ratio) else np.nan,
-    }
+    Lower-timeframe bars are mapped to their parent signal bar with ``searchsorted`` on the two
+    indexes, so the whole simulation is vectorized. Lower bars before the first signal bar or
+    after the end of the last one are ignored.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Signal timeframe data (e.g. 1d) containing the signal, price, and optional stop columns.
+    lower_df : pandas.DataFrame
+        Lower timeframe OHLC data (e.g. 1m) covering the same period, with "open", "low",
+        and "close" columns and a sorted index comparable to ``df.index``.
+    signal_column : str, default "signal"
+        Column containing discrete trade events (+1 enter long, -1 exit, 0 otherwise).
+    price_column : str, default "close"
+        Column of ``df`` used for the buy-and-hold benchmark returns.
+    stop_column : str, optional
+        Column of ``df`` holding the long stop level (e.g. the Supertrend long band).
+    slippage_bps : float, default 0.0
+        Adverse slippage, in basis points, applied to each entry and exit price.
+    bar_width : pandas.Timedelta, optional
+        Duration of one signal bar; inferred from the median spacing of ``df.index`` if omitted.
+    initial_capital : float, default 10_000.0
+        Starting equity for the simulation.
+    strategy_name : str, default "Strategy"
+        Name that will be stored in the result metadata.
+    parameters : dict[str, float], optional
+        Optional dictionary of strategy parameters for reporting.
+
+    Returns
+    -------
+    BacktestResult
+        Structured object whose dataframe additionally carries per-bar "held" (position open
+        at the bar close, after stops), "entry_price", "exit_price", and "stop_hit" columns.
+        "position" keeps the meaning it has in :func:`backtest_signals`.
+
+    Raises
+    ------
+    ValueError
+        If a signal bar in the held range (including the bar that closes a trade) has no
+        lower-timeframe bars or has non-finite lower-timeframe prices, if only one of the
+        indexes is timezone-aware, or if ``bar_width`` cannot be inferred.
+    """
+    if parameters is None:
+        parameters = {}
+
+    if df.empty:
+        raise ValueError("Cannot backtest an empty dataframe.")
+    if lower_df.empty:
+        raise ValueError("Cannot simulate fills with an empty lower-timeframe dataframe.")
+
+    if signal_column not in df.columns:
+        raise ValueError(f"Dataframe must include '{signal_column}' column generated by the strategy.")
+    if price_column not in df.columns:
+        raise ValueError(f"Dataframe must include '{price_column}' price column.")
+    if stop_column is not None and stop_column not in df.columns:
+        raise ValueError(f"Dataframe must include '{stop_column}' stop column.")
+    missing = {"open", "low", "close"} - set(lower_df.columns)
+    if missing:
+        missing_cols = ", ".join(sorted(missing))
+        raise ValueError(f"Lower-timeframe dataframe is missing columns: {missing_cols}")
+    if not (df.index.is_monotonic_increasing and lower_df.index.is_monotonic_increasing):
+        raise ValueError("Both dataframes must be sorted by index.")
+    if (getattr(df.index, "tz", None) is None) != (getattr(lower_df.index, "tz", None) is None):
+        raise ValueError("Both dataframe indexes must be either timezone-aware or timezone-naive.")
+    if bar_width is None:
+        if len(df) < 2:
+            raise ValueError("Parameter 'bar_width' is required for a single signal bar.")
+        bar_width = pd.Series(df.index[1:] - df.index[:-1]).median()
+
+    bt = df.copy()
+    slip = slippage_bps / 10_000.0
+
+    # Position decided on each signal bar, then lagged one bar as in backtest_signals.
+    signals = bt[signal_column].fillna(0).to_numpy()
+    target = pd.Series(np.where(signals == 1, 1.0, np.where(signals == -1, 0.0, np.nan)))
+    decided = target.ffill().fillna(0.0).to_numpy().astype(int)
+    desired = np.r_[0, decided[:-1]] > 0
+    # Number each holding period; 0 means flat. A repeated +1 opens a new period so a
+    # stopped-out trade can re-enter, while a still-open position simply carries over.
+    starts = desired & np.r_[False, signals[:-1] == 1]
+    trade_id = np.where(desired, np.cumsum(starts), 0)
+
+    stop_levels = np.full(len(bt), np.nan)
+    if stop_column is not None:
+        stop_levels = bt[stop_column].shift(1).to_numpy(dtype=float)
+
+    # Map every lower bar to the signal bar it falls in.
+    parent = bt.index.searchsorted(lower_df.index, side="right") - 1
+    in_range = (parent >= 0) & (lower_df.index < bt.index[-1] + bar_width)
+    parent = parent[in_range]
+    low_open = lower_df["open"].to_numpy(dtype=float)[in_range]
+    low_low = lower_df["low"].to_numpy(dtype=float)[in_range]
+    low_close = lower_df["close"].to_numpy(dtype=float)[in_range]
+    if parent.size == 0:
+        raise ValueError("Lower-timeframe dataframe does not overlap the signal dataframe.")
+
+    n_bars = len(bt)
+    # Every bar that holds the position or closes it needs lower bars to resolve fills.
+    covered = np.bincount(parent, minlength=n_bars) > 0
+    needed = desired | np.r_[False, desired[:-1]]
+    uncovered = needed & ~covered
+    if uncovered.any():
+        first_missing = bt.index[np.flatnonzero(uncovered)[0]]
+        raise ValueError(
+            f"Lower-timeframe dataframe has no bars for {int(uncovered.sum())} signal bar(s) "
+            f"in the held range, starting at {first_missing}."
+        )
+    lower_prices = np.column_stack([low_open, low_low, low_close])
+    non_finite = needed[parent] & ~np.isfinite(lower_prices).all(axis=1)
+    if non_finite.any():
+        first_bad = lower_df.index[in_range][np.flatnonzero(non_finite)[0]]
+        raise ValueError(
+            f"Lower-timeframe dataframe has non-finite prices in the held range at {first_bad}."
+        )
+
+    trade = trade_id[parent]
+    stop = stop_levels[parent]
+    prev_trade = np.r_[0, trade[:-1]]
+    trade_changed = trade != prev_trade
+
+    # First stop touch per trade; later bars of a stopped trade stay flat.
+    positions = np.arange(parent.size)
+    hit = (trade > 0) & (low_low <= stop)
+    hit_idx = positions[hit]
+    first_hit = np.full(trade_id.max() + 1, parent.size, dtype=np.int64)
+    if hit_idx.size:
+        hit_trades = trade[hit_idx]
+        first_of_trade = np.r_[True, hit_trades[1:] != hit_trades[:-1]]
+        first_hit[hit_trades[first_of_trade]] = hit_idx[first_of_trade]
+    cut = first_hit[trade]
+    stopped = (trade > 0) & (positions == cut)
+    live = (trade > 0) & (positions < cut)
+    pos_in = np.r_[False, live[:-1]]
+    entry = (trade > 0) & trade_changed & ~pos_in
+    signal_exit = pos_in & (trade == 0)
+
+    entry_px = low_open * (1 + slip)
+    stop_px = np.minimum(low_open, stop) * (1 - slip)
+    exit_px = np.where(stopped, stop_px, np.where(signal_exit, low_open * (1 - slip), np.nan))
+    exited = stopped | signal_exit
+
+    prev_close = np.r_[np.nan, low_close[:-1]]
+    reference = np.where(pos_in, prev_close, entry_px)
+    final = np.where(exited, exit_px, low_close)
+    active = pos_in | entry
+    lower_returns = np.where(active, final / np.where(active, reference, 1.0) - 1, 0.0)
+
+    bar_log_returns = np.bincount(parent, weights=np.log1p(lower_returns), minlength=n_bars)
+
+    entry_price = np.full(n_bars, np.nan)
+    entry_price[parent[entry]] = entry_px[entry]
+    exit_price = np.full(n_bars, np.nan)
+    exit_price[parent[exited]] = exit_px[exited]
+    stop_hit = np.zeros(n_bars, dtype=bool)
+    stop_hit[parent[stopped]] = True
+    # Position actually held at the close of each signal bar, after stops.
+    held = np.zeros(n_bars, dtype=int)
+    last_of_bar = np.r_[parent[1:] != parent[:-1], True]
+    held[parent[last_of_bar]] = live[last_of_bar].astype(int)
+
+    bt["position"] = decided
+    bt["held"] = held
+    bt["entry_price"] = entry_price
+    bt["exit_price"] = exit_price
+    bt["stop_hit"] = stop_hit
+    bt["returns"] = bt[price_column].pct_change().fillna(0.0)
+    bt["strategy_returns"] = np.expm1(bar_log_returns)
+
+    metrics = _finalize_backtest(bt, initial_capital)
 
     return BacktestResult(
         dataframe=bt,
@@ -261,20 +473,40 @@ def run_supertrend_backtest(
     visualize: bool = False,
     output_path: Optional[str] = None,
     show: bool = True,
+    lower_df: Optional[pd.DataFrame] = None,
+    slippage_bps: float = 0.0,
 ) -> BacktestResult:
     """
     Convenience wrapper that prepares Supertrend signals then delegates to the generic backtester.
+
+    When ``lower_df`` is provided, fills are simulated intrabar with :func:`backtest_intrabar`,
+    using the Supertrend long band as the protective stop. ``slippage_bps`` requires ``lower_df``.
     """
+    if slippage_bps and lower_df is None:
+        raise ValueError("Parameter 'slippage_bps' requires 'lower_df' for intrabar fills.")
     parameters = {"atr_period": atr_period, "multiplier": multiplier}
     enriched = supertrend_tv(df, atr_period=atr_period, multiplier=multiplier)
-    result = backtest_signals(
-        enriched,
-        signal_column="signal",
-        price_column="close",
-        initial_capital=initial_capital,
-        strategy_name="Supertrend",
-        parameters=parameters,
-    )
+    if lower_df is not None:
+        result = backtest_intrabar(
+            enriched,
+            lower_df,
+            signal_column="signal",
+            price_column="close",
+            stop_column=f"SUPERTl_{atr_period}_{multiplier}",
+            slippage_bps=slippage_bps,
+            initial_capital=initial_capital,
+            strategy_name="Supertrend",
+            parameters=parameters,
+        )
+    else:
+        result = backtest_signals(
+            enriched,
+            signal_column="signal",
+            price_column="close",
+            initial_capital=initial_capital,
+            strategy_name="Supertrend",
+            parameters=parameters,
+        )
 
     if visualize:
         from visualization.kline import render_kline
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Sequence
+from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from data.binance_client import create_exchange
+from data.ohlcv_quality import OHLCV_DTYPE, OHLCVQualityReport, sort_unique, validate_ohlcv
 
 __all__ = [
     "fetch_daily_ohlcv",
+    "fetch_daily_ohlcv_with_report",
     "load_recent_daily",
 ]
 
 
+logger = logging.getLogger(__name__)
+
 _ONE_DAY_MS = 24 * 60 * 60 * 1000
 _MAX_FETCH_LIMIT = 1000  # Binance limit for a single OHLCV request
 
@@ -27,11 +33,19 @@ def _fetch_batches(
     timeframe: str,
     total_required: int,
     since: Optional[int] = None,
-) -> List[Sequence[float]]:
-    ohlcv: List[Sequence[float]] = []
+) -> Tuple[np.ndarray, int]:
+    """
+    Download candles straight into a preallocated structured array (see OHLCV_DTYPE).
+
+    Each batch is merged with :func:`sort_unique`, so only distinct candles count towards
+    ``total_required``. Returns the sorted records and the number of duplicates dropped.
+    """
+    records = np.empty(total_required, dtype=OHLCV_DTYPE)
+    filled = 0
+    duplicates = 0
     fetch_since = since
-    while len(ohlcv) < total_required:
-        remaining = total_required - len(ohlcv)
+    while filled < total_required:
+        remaining = total_required - filled
         fetch_limit = min(_MAX_FETCH_LIMIT, remaining)
         batch = exchange.fetch_ohlcv(
             symbol,
@@ -41,54 +55,97 @@ def _fetch_batches(
         )
         if not batch:
             break
-        ohlcv.extend(batch)
+        rows = np.asarray(batch, dtype=np.float64)[:remaining]
+        target = records[filled : filled + len(rows)]
+        for column, name in enumerate(OHLCV_DTYPE.names):
+            target[name] = rows[:, column]
+        unique, _ = sort_unique(records[: filled + len(rows)])
+        added = len(unique) - filled
+        records[: len(unique)] = unique
+        duplicates += len(rows) - added
+        filled = len(unique)
         last_ts = batch[-1][0]
         fetch_since = last_ts + _ONE_DAY_MS
-        if len(batch) < fetch_limit:
+        if len(batch) < fetch_limit or added == 0:
             break
-    return ohlcv
+    return records[:filled], duplicates
 
 
-def fetch_daily_ohlcv(
+def fetch_daily_ohlcv_with_report(
     symbol: str,
     *,
     days: int,
     exchange=None,
     include_symbol: bool = True,
-) -> pd.DataFrame:
+    validate: bool = True,
+    repair: bool = False,
+) -> Tuple[pd.DataFrame, Optional[OHLCVQualityReport]]:
     """
-    Fetch daily OHLCV candles for the requested number of days (most recent first).
+    Fetch daily OHLCV candles together with their data-quality report.
+
+    Candles are requested from the start of the ``days`` window, de-duplicated and sorted as
+    they arrive, then checked for gaps, bad candles, zero volume, off-grid timestamps, and
+    outliers. Findings are logged; ``repair=True`` drops/fixes bad candles and fills gaps
+    before the frame is built. The report is None when validation is disabled.
     """
     if days <= 0:
         raise ValueError("Parameter 'days' must be positive.")
     exchange = _ensure_exchange(exchange)
-    raw_ohlcv = _fetch_batches(exchange, symbol, "1d", total_required=days)
-    if not raw_ohlcv:
-        return pd.DataFrame(columns=["open", "high", "low", "close", "volume", "is_closed"])
+    now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+    since = (now_ms // _ONE_DAY_MS - (days - 1)) * _ONE_DAY_MS
+    records, duplicates = _fetch_batches(exchange, symbol, "1d", total_required=days, since=since)
+    if not records.size:
+        empty = pd.DataFrame(columns=["open", "high", "low", "close", "volume", "is_closed"])
+        return empty, None
+
+    report = None
+    if validate or repair:
+        records, report = validate_ohlcv(
+            records,
+            interval_ms=_ONE_DAY_MS,
+            duplicates=duplicates,
+            repair=repair,
+        )
+        if not report.is_clean:
+            logger.warning("Data-quality issues in %s daily candles: %s", symbol, report.summary())
+    records = records[-days:]
 
+    index = pd.to_datetime(records["timestamp"], unit="ms", utc=True)
     df = pd.DataFrame(
-        raw_ohlcv,
-        columns=["timestamp", "open", "high", "low", "close", "volume"],
-    )
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-    df.set_index("timestamp", inplace=True)
-    df.sort_index(inplace=True)
-    df = df.tail(days)
-
-    df = df.astype(
-        {
-            "open": float,
-            "high": float,
-            "low": float,
-            "close": float,
-            "volume": float,
-        }
+        {name: records[name] for name in OHLCV_DTYPE.names[1:]},
+        index=pd.DatetimeIndex(index, name="timestamp"),
+        copy=False,
     )
 
     if include_symbol:
         df["symbol"] = symbol
 
     df["is_closed"] = True
+    return df, report
+
+
+def fetch_daily_ohlcv(
+    symbol: str,
+    *,
+    days: int,
+    exchange=None,
+    include_symbol: bool = True,
+    validate: bool = True,
+    repair: bool = False,
+) -> pd.DataFrame:
+    """
+    Fetch daily OHLCV candles for the requested number of days (most recent first).
+
+    See :func:`fetch_daily_ohlcv_with_report` for the validation and repair behaviour.
+    """
+    df, _ = fetch_daily_ohlcv_with_report(
+        symbol,
+        days=days,
+        exchange=exchange,
+        include_symbol=include_symbol,
+        validate=validate,
+        repair=repair,
+    )
     return df
 
 
@@ -98,12 +155,23 @@ def load_recent_daily(
     days: int,
     exchange=None,
     refresh_live_close: bool = True,
+    validate: bool = True,
+    repair: bool = False,
 ) -> pd.DataFrame:
     """
     Load daily OHLCV data and flag whether the latest candle is closed.
+
+    ``validate`` and ``repair`` are forwarded to :func:`fetch_daily_ohlcv`.
     """
     exchange = _ensure_exchange(exchange)
-    df = fetch_daily_ohlcv(symbol, days=days, exchange=exchange, include_symbol=True)
+    df = fetch_daily_ohlcv(
+        symbol,
+        days=days,
+        exchange=exchange,
+        include_symbol=True,
+        validate=validate,
+        repair=repair,
+    )
     if df.empty:
         return df
 
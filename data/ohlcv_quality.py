@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "OHLCV_DTYPE",
+    "OHLCVQualityReport",
+    "sort_unique",
+    "validate_ohlcv",
+]
+
+
+OHLCV_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("volume", np.float64),
+    ]
+)
+
+_PRICE_FIELDS = ("open", "high", "low", "close")
+
+
+def _to_index(timestamps: np.ndarray) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(pd.to_datetime(timestamps, unit="ms", utc=True))
+
+
+@dataclass
+class OHLCVQualityReport:
+    """
+    Findings of :func:`validate_ohlcv`; timestamps refer to the candles as received.
+    """
+
+    duplicates: int
+    gaps: pd.DatetimeIndex
+    missing_candles: int
+    off_grid: pd.DatetimeIndex
+    invalid: pd.DatetimeIndex
+    inconsistent: pd.DatetimeIndex
+    zero_volume: pd.DatetimeIndex
+    outliers: pd.DatetimeIndex
+    repaired: bool = False
+
+    @property
+    def is_clean(self) -> bool:
+        return not any(self.summary().values())
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Accessor returning the number of findings per check.
+        """
+        return {
+            "duplicates": self.duplicates,
+            "missing_candles": self.missing_candles,
+            "off_grid": len(self.off_grid),
+            "invalid": len(self.invalid),
+            "inconsistent": len(self.inconsistent),
+            "zero_volume": len(self.zero_volume),
+            "outliers": len(self.outliers),
+        }
+
+
+def sort_unique(records: np.ndarray) -> Tuple[np.ndarray, int]:
+    """
+    Sort OHLCV records by timestamp and drop duplicates in a single pass.
+
+    When a timestamp appears more than once, the most recently received candle wins.
+    Returns the cleaned records and the number of duplicates removed.
+    """
+    reversed_records = records[::-1]
+    _, first_in_reversed = np.unique(reversed_records["timestamp"], return_index=True)
+    unique = reversed_records[first_in_reversed]
+    return unique, len(records) - len(unique)
+
+
+def validate_ohlcv(
+    records: np.ndarray,
+    *,
+    interval_ms: int,
+    duplicates: int = 0,
+    outlier_threshold: float = 10.0,
+    repair: bool = False,
+) -> Tuple[np.ndarray, OHLCVQualityReport]:
+    """
+    Run vectorized sanity checks over sorted, de-duplicated OHLCV records.
+
+    Parameters
+    ----------
+    records : numpy.ndarray
+        Structured array with :data:`OHLCV_DTYPE`, sorted by unique timestamps.
+    interval_ms : int
+        Expected spacing between consecutive candles in milliseconds. Candles are expected to
+        open on multiples of it since the Unix epoch; others are reported as off-grid.
+    duplicates : int, default 0
+        Number of duplicates already removed by :func:`sort_unique`, carried into the report.
+    outlier_threshold : float, default 10.0
+        Close-to-close log returns further than this many robust standard deviations
+        (scaled median absolute deviation) from the median are flagged as outliers. Only
+        returns between adjacent, consistent candles are considered.
+    repair : bool, default False
+        If True, drop off-grid candles and those with non-finite or non-positive prices,
+        widen high/low so they envelope open/close, and fill gaps with flat zero-volume
+        candles at the previous close.
+        Outliers and zero-volume candles are only reported.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, OHLCVQualityReport]
+        The (possibly repaired) records and the report of findings.
+    """
+    timestamps = records["timestamp"]
+    prices = np.column_stack([records[name] for name in _PRICE_FIELDS])
+    volume = records["volume"]
+
+    invalid = ~np.isfinite(prices).all(axis=1) | (prices <= 0).any(axis=1)
+    invalid |= ~np.isfinite(volume) | (volume < 0)
+    body_high = np.maximum(records["open"], records["close"])
+    body_low = np.minimum(records["open"], records["close"])
+    inconsistent = ~invalid & (
+        (records["high"] < records["low"])
+        | (records["high"] < body_high)
+        | (records["low"] > body_low)
+    )
+    zero_volume = ~invalid & (volume == 0)
+    off_grid = timestamps % interval_ms != 0
+
+    steps = np.diff(timestamps)
+    gap_mask = steps > interval_ms
+    missing_candles = int((steps[gap_mask] // interval_ms - 1).sum())
+
+    # Only returns between adjacent, well-formed candles feed the outlier statistics.
+    outliers = np.zeros(len(records), dtype=bool)
+    usable_idx = np.flatnonzero(~invalid & ~inconsistent)
+    adjacent = np.diff(timestamps[usable_idx]) == interval_ms
+    if adjacent.sum() > 1:
+        log_returns = np.diff(np.log(records["close"][usable_idx]))[adjacent]
+        median = np.median(log_returns)
+        scale = 1.4826 * np.median(np.abs(log_returns - median))
+        if scale > 0:
+            flagged = np.abs(log_returns - median) > outlier_threshold * scale
+            outliers[usable_idx[1:][adjacent][flagged]] = True
+
+    report = OHLCVQualityReport(
+        duplicates=duplicates,
+        gaps=_to_index(timestamps[:-1][gap_mask]),
+        missing_candles=missing_candles,
+        off_grid=_to_index(timestamps[off_grid]),
+        invalid=_to_index(timestamps[invalid]),
+        inconsistent=_to_index(timestamps[inconsistent]),
+        zero_volume=_to_index(timestamps[zero_volume]),
+        outliers=_to_index(timestamps[outliers]),
+        repaired=repair,
+    )
+
+    if not repair:
+        return records, report
+
+    # Dropping off-grid candles keeps one candle per grid slot below.
+    repaired = records[~invalid & ~off_grid]
+    if repaired.size == 0:
+        return repaired, report
+
+    repaired_prices = [repaired[name].copy() for name in _PRICE_FIELDS]
+    repaired["high"] = np.maximum.reduce(repaired_prices)
+    repaired["low"] = np.minimum.reduce(repaired_prices)
+
+    first_ts = repaired["timestamp"][0]
+    slots = (repaired["timestamp"] - first_ts) // interval_ms
+    filled = np.zeros(int(slots[-1]) + 1, dtype=OHLCV_DTYPE)
+    filled["timestamp"] = first_ts + np.arange(len(filled), dtype=np.int64) * interval_ms
+    filled[slots] = repaired
+    present = np.zeros(len(filled), dtype=bool)
+    present[slots] = True
+    if not present.all():
+        last_present = np.maximum.accumulate(np.where(present, np.arange(len(filled)), 0))
+        previous_close = filled["close"][last_present]
+        missing = ~present
+        for name in _PRICE_FIELDS:
+            filled[name][missing] = previous_close[missing]
+    return filled, report
@@ -1,7 +1,6 @@
-import pandas_ta as ta
-
-
 def supertrend_tv(df, atr_period, multiplier):  
+    import pandas_ta as ta
+
     df_supertrend = ta.supertrend(df['high'], df['low'], df['close'], length=atr_period, atr_length=atr_period, multiplier=multiplier, atr_mamode='rma', offset=1)
     direction_col = f"SUPERTd_{atr_period}_{multiplier}"
     df_final = df.join(df_supertrend)
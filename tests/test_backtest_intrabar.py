@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import backtest_intrabar, backtest_signals
+
+
+def _frames(days, signals, stops=None):
+    """
+    Build a daily frame and a 6-hourly lower frame from per-day lists of (open, low, close).
+    """
+    lower_index = []
+    lower_rows = []
+    daily_index = pd.date_range("2024-01-01", periods=len(days), freq="1D", tz="UTC")
+    for day, bars in zip(daily_index, days):
+        for i, bar in enumerate(bars):
+            lower_index.append(day + pd.Timedelta(hours=6 * i))
+            lower_rows.append(bar)
+    lower = pd.DataFrame(lower_rows, columns=["open", "low", "close"], index=pd.DatetimeIndex(lower_index))
+    daily = pd.DataFrame(
+        {
+            "close": [bars[-1][2] for bars in days],
+            "signal": signals,
+        },
+        index=daily_index,
+    )
+    if stops is not None:
+        daily["stop"] = stops
+    return daily, lower
+
+
+def _flat(price, n=4):
+    return [(price, price, price)] * n
+
+
+def test_matches_backtest_signals_without_stop_or_slippage():
+    rng = np.random.default_rng(7)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 60 * 4)))
+    opens = np.r_[100.0, closes[:-1]]
+    days = [
+        list(zip(opens[i : i + 4], np.minimum(opens, closes)[i : i + 4], closes[i : i + 4]))
+        for i in range(0, len(closes), 4)
+    ]
+    signals = rng.choice([0, 0, 0, 1, -1], size=len(days))
+    daily, lower = _frames(days, signals)
+
+    intrabar = backtest_intrabar(daily, lower)
+    reference = backtest_signals(daily)
+
+    np.testing.assert_allclose(
+        intrabar.dataframe["strategy_returns"], reference.dataframe["strategy_returns"], atol=1e-12
+    )
+    assert (intrabar.dataframe["position"] == reference.dataframe["position"]).all()
+    assert intrabar.metrics["total_return"] == pytest.approx(reference.metrics["total_return"])
+
+
+def test_stop_hit_on_entry_bar():
+    days = [
+        _flat(100),
+        [(100, 99, 99), (99, 94, 96), (96, 96, 98), (98, 98, 98)],
+        _flat(98),
+    ]
+    daily, lower = _frames(days, [1, 0, 0], stops=[95.0, 95.0, 95.0])
+
+    bt = backtest_intrabar(daily, lower, stop_column="stop").dataframe
+
+    assert bt["entry_price"].iloc[1] == 100
+    assert bt["exit_price"].iloc[1] == 95
+    assert bt["stop_hit"].iloc[1]
+    assert bt["held"].iloc[1] == 0
+    assert bt["strategy_returns"].iloc[1] == pytest.approx(95 / 100 - 1)
+    assert bt["strategy_returns"].iloc[2] == 0
+
+
+def test_gap_through_stop_fills_at_open():
+    days = [
+        _flat(100),
+        _flat(100),
+        [(90, 88, 89), (89, 89, 89), (89, 89, 89), (89, 89, 89)],
+    ]
+    daily, lower = _frames(days, [1, 0, 0], stops=[95.0, 95.0, 95.0])
+
+    bt = backtest_intrabar(daily, lower, stop_column="stop", slippage_bps=10).dataframe
+
+    assert bt["exit_price"].iloc[2] == pytest.approx(90 * (1 - 0.001))
+    assert bt["stop_hit"].iloc[2]
+
+
+def test_stays_flat_after_stop_until_next_entry():
+    days = [
+        _flat(100),
+        [(100, 94, 96), (96, 96, 96), (96, 96, 96), (96, 96, 96)],
+        [(96, 96, 110)] + _flat(110, 3),
+        _flat(110),
+        [(110, 110, 121)] + _flat(121, 3),
+    ]
+    daily, lower = _frames(days, [1, 0, 0, 1, 0], stops=[95.0] * 5)
+
+    bt = backtest_intrabar(daily, lower, stop_column="stop").dataframe
+
+    assert bt["held"].tolist() == [0, 0, 0, 0, 1]
+    assert bt["strategy_returns"].iloc[2] == 0
+    assert bt["entry_price"].iloc[4] == 110
+    assert bt["strategy_returns"].iloc[4] == pytest.approx(121 / 110 - 1)
+
+
+def test_exit_then_reentry_on_next_bar():
+    days = [
+        _flat(100),
+        _flat(100),
+        [(105, 105, 105)] + _flat(105, 3),
+        [(102, 102, 104)] + _flat(104, 3),
+        _flat(104),
+    ]
+    daily, lower = _frames(days, [1, -1, 1, 0, 0])
+
+    bt = backtest_intrabar(daily, lower).dataframe
+
+    assert bt["exit_price"].iloc[2] == 105
+    assert bt["entry_price"].iloc[3] == 102
+    assert bt["held"].tolist() == [0, 1, 0, 1, 1]
+    assert bt["position"].tolist() == [1, 0, 1, 1, 1]
+    assert bt["strategy_returns"].iloc[3] == pytest.approx(104 / 102 - 1)
+
+
+def test_missing_lower_bars_in_held_range_raises():
+    days = [_flat(100), _flat(101), _flat(102)]
+    daily, lower = _frames(days, [1, 0, 0])
+    lower = lower[lower.index >= daily.index[2]]
+
+    with pytest.raises(ValueError, match="no bars"):
+        backtest_intrabar(daily, lower)
+
+
+def test_mixed_timezones_raise():
+    daily, lower = _frames([_flat(100), _flat(101)], [1, 0])
+    lower.index = lower.index.tz_localize(None)
+
+    with pytest.raises(ValueError, match="timezone"):
+        backtest_intrabar(daily, lower)
+
+
+def test_lower_bars_past_last_signal_bar_are_ignored():
+    days = [_flat(100), [(100, 100, 110)] + _flat(110, 3), _flat(110)]
+    daily, lower = _frames(days, [1, 0, 0])
+    extra_index = pd.date_range(daily.index[-1] + pd.Timedelta(days=1), periods=8, freq="6h")
+    extra = pd.DataFrame({"open": 150.0, "low": 150.0, "close": 150.0}, index=extra_index)
+    lower = pd.concat([lower, extra])
+
+    bt = backtest_intrabar(daily, lower).dataframe
+
+    assert bt["strategy_returns"].iloc[1] == pytest.approx(110 / 100 - 1)
+    assert bt["strategy_returns"].iloc[2] == 0
+
+
+def test_non_finite_lower_prices_in_held_range_raise():
+    days = [_flat(100), [(100, 99, 99), (99, 98, np.nan), (98, 97, 97), (97, 96, 96)], _flat(96)]
+    daily, lower = _frames(days, [1, 0, 0])
+
+    with pytest.raises(ValueError, match="non-finite"):
+        backtest_intrabar(daily, lower)
@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ccxt")
+
+from data.ohlcv_loader import fetch_daily_ohlcv, fetch_daily_ohlcv_with_report  # noqa: E402
+
+_ONE_DAY_MS = 24 * 60 * 60 * 1000
+
+
+class _StubExchange:
+    """
+    Serves candles from ``since`` onwards, like ccxt's fetch_ohlcv.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetch_ohlcv(self, symbol, timeframe, since, limit):
+        return [row for row in self.rows if row[0] >= since][:limit]
+
+
+def _rows(count):
+    today = int(datetime.now(timezone.utc).timestamp() * 1000) // _ONE_DAY_MS * _ONE_DAY_MS
+    start = today - (count - 1) * _ONE_DAY_MS
+    return [
+        [start + i * _ONE_DAY_MS, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 10.0]
+        for i in range(count)
+    ]
+
+
+def test_duplicates_do_not_shrink_the_result():
+    rows = _rows(5)
+    rows.insert(2, list(rows[1]))
+
+    df, report = fetch_daily_ohlcv_with_report("BTC/USDT", days=5, exchange=_StubExchange(rows))
+
+    assert len(df) == 5
+    assert df.index.is_unique and df.index.is_monotonic_increasing
+    assert report.duplicates == 1
+
+
+def test_repaired_frame_is_trimmed_to_days():
+    rows = _rows(6)
+    del rows[3]
+
+    df, report = fetch_daily_ohlcv_with_report(
+        "BTC/USDT", days=6, exchange=_StubExchange(rows), repair=True
+    )
+
+    assert len(df) == 6
+    assert report.missing_candles == 1
+    assert df["close"].iloc[3] == df["close"].iloc[2]
+
+
+def test_bad_candles_are_reported_and_repaired():
+    rows = _rows(5)
+    rows[2][1] = None  # missing open
+    rows[3][2], rows[3][3] = 98.0, 104.0  # high < low
+
+    df, report = fetch_daily_ohlcv_with_report("BTC/USDT", days=5, exchange=_StubExchange(rows))
+    assert report.summary()["invalid"] == 1
+    assert report.summary()["inconsistent"] == 1
+    assert np.isnan(df["open"].iloc[2])
+
+    repaired = fetch_daily_ohlcv("BTC/USDT", days=5, exchange=_StubExchange(rows), repair=True)
+    assert len(repaired) == 5
+    assert repaired["open"].iloc[2] == repaired["close"].iloc[1]
+    assert repaired["volume"].iloc[2] == 0
+    assert repaired["high"].iloc[3] >= repaired["low"].iloc[3]
+    assert repaired["low"].iloc[3] == 98.0
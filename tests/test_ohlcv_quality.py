@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.ohlcv_quality import OHLCV_DTYPE, sort_unique, validate_ohlcv
+
+_ONE_DAY_MS = 24 * 60 * 60 * 1000
+
+
+def _records(rows):
+    return np.array([tuple(row) for row in rows], dtype=OHLCV_DTYPE)
+
+
+def _day(i, close=100.0, volume=10.0):
+    return (i * _ONE_DAY_MS, close, close + 1, close - 1, close, volume)
+
+
+def _trend(days):
+    closes = 100.0 * np.exp(np.cumsum(np.random.default_rng(3).normal(0, 0.01, 64)))
+    return [_day(i, close=float(closes[i])) for i in days]
+
+
+def test_sort_unique_keeps_latest_candle():
+    records = _records([_day(2), _day(0, close=100), _day(1), _day(0, close=105)])
+
+    unique, duplicates = sort_unique(records)
+
+    assert duplicates == 1
+    assert unique["timestamp"].tolist() == [0, _ONE_DAY_MS, 2 * _ONE_DAY_MS]
+    assert unique["close"][0] == 105
+
+
+def test_clean_records_report_nothing():
+    _, report = validate_ohlcv(_records(_trend(range(30))), interval_ms=_ONE_DAY_MS)
+
+    assert report.is_clean
+
+
+def test_gaps_are_counted():
+    records = _records(_trend([0, 1, 2, 5, 6]))
+
+    _, report = validate_ohlcv(records, interval_ms=_ONE_DAY_MS)
+
+    assert report.missing_candles == 2
+    assert list(report.gaps) == [pd.Timestamp(2 * _ONE_DAY_MS, unit="ms", tz="UTC")]
+    assert len(report.outliers) == 0
+
+
+def test_bad_candles_are_flagged():
+    rows = _trend(range(10))
+    rows[3] = (3 * _ONE_DAY_MS, 100.0, 98.0, 99.0, 98.5, 10.0)  # high < low
+    rows[5] = _day(5, close=rows[5][4], volume=0.0)
+    rows[7] = (7 * _ONE_DAY_MS, np.nan, 101.0, 99.0, 100.0, 10.0)
+
+    _, report = validate_ohlcv(_records(rows), interval_ms=_ONE_DAY_MS)
+
+    assert report.summary()["inconsistent"] == 1
+    assert report.inconsistent[0] == pd.Timestamp(3 * _ONE_DAY_MS, unit="ms", tz="UTC")
+    assert report.zero_volume[0] == pd.Timestamp(5 * _ONE_DAY_MS, unit="ms", tz="UTC")
+    assert report.summary()["invalid"] == 1
+
+
+def test_outlier_is_flagged():
+    rows = _trend(range(30))
+    rows[15] = _day(15, close=1000.0)
+
+    _, report = validate_ohlcv(_records(rows), interval_ms=_ONE_DAY_MS)
+
+    assert pd.Timestamp(15 * _ONE_DAY_MS, unit="ms", tz="UTC") in report.outliers
+
+
+def test_repair_fills_gaps_at_previous_close():
+    rows = _trend([0, 1, 2, 5])
+    rows[1] = (_ONE_DAY_MS, 100.0, 98.0, 99.0, 98.5, 10.0)
+
+    repaired, report = validate_ohlcv(_records(rows), interval_ms=_ONE_DAY_MS, repair=True)
+
+    assert report.repaired
+    assert repaired["timestamp"].tolist() == [i * _ONE_DAY_MS for i in range(6)]
+    previous_close = rows[2][4]
+    for name in ("open", "high", "low", "close"):
+        assert repaired[name][3] == pytest.approx(previous_close)
+        assert repaired[name][4] == pytest.approx(previous_close)
+    assert repaired["volume"][3] == 0
+    assert repaired["high"][1] == 100.0
+    assert repaired["low"][1] == 98.0
+
+
+def test_off_grid_candles_are_reported_and_not_merged():
+    rows = _trend(range(4))
+    rows[2] = (2 * _ONE_DAY_MS + 3_600_000,) + tuple(rows[2][1:])
+    rows.insert(3, (2 * _ONE_DAY_MS + 7_200_000,) + tuple(rows[1][1:]))
+    records = _records(rows)
+
+    repaired, report = validate_ohlcv(records, interval_ms=_ONE_DAY_MS, repair=True)
+
+    assert not report.is_clean
+    assert report.summary()["off_grid"] == 2
+    assert repaired["timestamp"].tolist() == [i * _ONE_DAY_MS for i in range(4)]
+    assert repaired["volume"][2] == 0